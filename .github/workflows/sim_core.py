@@ -0,0 +1,304 @@
+import math
+import multiprocessing
+import os
+import sys
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Render straight to files; no display is needed or available in CI
+import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d import Axes3D
+from numba import njit
+
+# Quantities tracked by the simulation, in state column order: name -> (title, axis label)
+QUANTITIES = {
+    'plasma_velocity': ('Plasma Velocity', 'Plasma Velocity (m/s)'),
+    'lorentz_factor': ('Lorentz Factor', 'Lorentz Factor (γ)'),
+    'energy_density': ('Energy Density', 'Energy Density (J/m³)'),
+    'field_strength': ('Field Strength', 'Field Strength (J/m³)'),
+    'temperature': ('Temperature', 'Temperature (K)'),
+    'pressure': ('Pressure', 'Pressure (Pa)'),
+    'quantum_tunneling_probability': ('Quantum Tunneling Probability', 'Quantum Tunneling Probability'),
+    'spacetime_curvature': ('Spacetime Curvature', 'Spacetime Curvature (m^-2)'),
+    'volume': ('Volume', 'Volume'),
+    'time_dilation': ('Time Dilation', 'Time Dilation Factor'),
+    'dimension_portal_probability': ('Dimension Portal Probability', 'Dimension Portal Probability'),
+}
+
+# Columns of the simulation state array
+(
+    IDX_PLASMA_VELOCITY,
+    IDX_LORENTZ_FACTOR,
+    IDX_ENERGY_DENSITY,
+    IDX_FIELD_STRENGTH,
+    IDX_TEMPERATURE,
+    IDX_PRESSURE,
+    IDX_QUANTUM_TUNNELING_PROBABILITY,
+    IDX_SPACETIME_CURVATURE,
+    IDX_VOLUME,
+    IDX_TIME_DILATION,
+    IDX_DIMENSION_PORTAL_PROBABILITY,
+) = range(len(QUANTITIES))
+
+# Magnetic permeability of free space
+mu_0 = 4 * np.pi * 1e-7
+
+# Function to gradually increase acceleration
+def increasing_acceleration(t, config):
+    initial_acceleration = config['initial_acceleration']
+    return initial_acceleration + (config['max_acceleration'] - initial_acceleration) * (t / config['total_time'])
+
+# Function to calculate magnetic pressure effect based on magnetic field
+def magnetic_pressure_effect(B):
+    return B**2 / (2 * mu_0)
+
+# Function to build the observer count at every time step. New observers arrive every observer_interval
+# steps, either adding `step` observers ('add') or multiplying the count by `step` ('multiply').
+def observer_schedule(n, initial_observers, observer_interval, growth, step):
+    intervals = np.arange(n) // observer_interval
+    if growth == 'add':
+        observers = initial_observers + step * intervals
+    elif growth == 'multiply':
+        with np.errstate(over='ignore'):
+            observers = initial_observers * float(step)**intervals
+    else:
+        raise ValueError(f"Unknown observer growth: {growth!r}")
+    return np.minimum(observers, 1e6)  # Cap the number of observers to prevent overflow
+
+# Function to run the simulation described by `config`. Returns the time grid and one array per
+# quantity, keyed '<quantity>_array'; the quantity arrays are column views of a single state array.
+def simulate(config, dtype=np.float64):
+    c = config['c']
+    cap_value = config['cap_value']
+    dt = config['total_time'] / config['time_steps']  # Time step size
+
+    # Arrays to store data
+    time_array = np.arange(0, config['total_time'], dt)
+    state = np.empty((len(time_array), len(QUANTITIES)))
+    state[0] = 0.0  # Row 0 holds the zeroed initial state; every later row is overwritten below
+
+    # Loop invariants: c is constant, so fold its powers once
+    inv_c2 = 1.0 / (c * c)
+    inv_c4 = inv_c2 * inv_c2
+
+    # Simulation (vectorized over the whole time grid)
+    steps = np.arange(1, len(time_array))
+    current_time = time_array[1:]
+
+    # Update acceleration
+    acceleration = increasing_acceleration(current_time, config)
+
+    # Update plasma velocity. The Euler step v[i] = r * v[i-1] + a[i] * dt with r = 1 - damping_factor * dt
+    # is a linear recurrence, so v[i] = r**i * (v[0] + sum(a[j] * dt * r**-j for j <= i))
+    decay = (1 - config['damping_factor'] * dt) ** steps
+    plasma_velocity = decay * (config['plasma_velocity'] + np.cumsum(acceleration * dt / decay))
+    plasma_velocity = np.minimum(plasma_velocity, c - 1e-10)  # Cap to just below the speed of light to avoid division by zero in Lorentz factor
+    lorentz_factor = 1 / np.sqrt(1 - (plasma_velocity / c)**2)
+
+    # Pressure either holds at the magnetic containment pressure or rises at a fixed rate
+    if config['magnetic_pressure']:
+        pressure = magnetic_pressure_effect(config['B'])
+    else:
+        pressure = config['pressure'] + config['pressure_rate'] * dt * steps
+
+    # Gradually introduce observers
+    current_observers = observer_schedule(
+        len(time_array), config['initial_observers'], config['observer_interval'],
+        config['observer_growth'], config['observer_step'])[1:]
+
+    # Update field strength with observer influence using logarithmic scaling, capped to prevent overflow
+    observer_factor = np.log1p(config['observer_influence_factor'] * current_observers)
+    field_strength = _capped_field_strength(observer_factor, config['field_strength'], cap_value)
+
+    # Update energy density with a cap
+    energy_density = np.minimum(0.5 * (field_strength**2) * (plasma_velocity**2), cap_value)
+
+    # Calculate the volume of space influenced by the observers
+    volume = current_observers * config['volume_per_observer']
+
+    # Update temperature
+    temperature = config['temperature'] + 1e5 * dt * steps
+
+    # Update quantum tunneling probability and spacetime curvature
+    quantum_tunneling_probability = 1 - np.exp(-field_strength / cap_value)
+    spacetime_curvature = 2.0 * energy_density * inv_c4
+
+    # Calculate time dilation based on spacetime curvature and Lorentz factor
+    time_dilation = lorentz_factor * np.sqrt(1 - 2.0 * spacetime_curvature * config['mass_particle'] * inv_c2)
+
+    # Calculate probability of creating an interdimensional portal
+    dimension_portal_probability = np.tanh(spacetime_curvature / cap_value)
+
+    # Store data
+    state[1:, IDX_PLASMA_VELOCITY] = plasma_velocity
+    state[1:, IDX_LORENTZ_FACTOR] = lorentz_factor
+    state[1:, IDX_ENERGY_DENSITY] = energy_density
+    state[1:, IDX_FIELD_STRENGTH] = field_strength
+    state[1:, IDX_TEMPERATURE] = temperature
+    state[1:, IDX_PRESSURE] = pressure
+    state[1:, IDX_QUANTUM_TUNNELING_PROBABILITY] = quantum_tunneling_probability
+    state[1:, IDX_SPACETIME_CURVATURE] = spacetime_curvature
+    state[1:, IDX_VOLUME] = volume
+    state[1:, IDX_TIME_DILATION] = time_dilation
+    state[1:, IDX_DIMENSION_PORTAL_PROBABILITY] = dimension_portal_probability
+
+    # Downcast for storage and plotting if requested; the simulation itself runs in float64. float32 rounds
+    # factors within ~1e-7 of 1 (Lorentz factor, time dilation at low velocity) to exactly 1
+    state = state.astype(dtype, copy=False)
+
+    # Per-quantity views into the state array (no copies)
+    results = {'time_array': time_array}
+    for idx, name in enumerate(QUANTITIES):
+        results[f'{name}_array'] = state[:, idx]
+    return results
+
+# Field strength scan for the simulation. Each step multiplies by observer_factor[i] and caps the result.
+# Factors below 1 (log1p(1.1) for a single observer) pull a capped value back under the cap, so clipping
+# a cumprod afterwards would not match; it runs as a compiled 1-D loop instead.
+@njit(cache=True)
+def _capped_field_strength(observer_factor, field_strength, cap_value):
+    scan = np.empty(len(observer_factor))
+    for i in range(len(observer_factor)):
+        field_strength *= observer_factor[i]
+        if field_strength > cap_value:
+            field_strength = cap_value
+        scan[i] = field_strength
+    return scan
+
+# Field strength scan for the 3D surface. Each step applies f = log1p(f * observer_factor[i]),
+# which is not associative, so it runs as a compiled 1-D loop instead of a cumulative ufunc.
+@njit(cache=True)
+def _field_strength_scan(observer_factor, field_strength):
+    scan = np.empty(len(observer_factor))
+    scan[0] = 0.0
+    for i in range(1, len(observer_factor)):
+        field_strength = math.log1p(field_strength * observer_factor[i])
+        scan[i] = field_strength
+    return scan
+
+# Function to compute the field strength surface, one column per observer influence factor
+def field_strength_surface(config, time_array, observer_factors):
+    observers = observer_schedule(
+        len(time_array), config['initial_observers'], config['observer_interval'],
+        config['surface_observer_growth'], config['surface_observer_step'])
+    observer_factor = np.log1p(config['observer_influence_factor'] * observers)
+
+    # The update does not depend on the factor being swept, so one scan fills every column
+    Z = np.empty((len(time_array), len(observer_factors)))
+    Z[:, :] = _field_strength_scan(observer_factor, config['field_strength'])[:, np.newaxis]
+    return Z
+
+# Function to remove non-finite values
+def remove_non_finite(data):
+    return data[np.isfinite(data)]
+
+# Function to write a figure to plot_<name>.png and release its artists
+def save_figure(fig, name):
+    fig.savefig(f'plot_{name}.png', dpi=80, bbox_inches='tight')
+    plt.close(fig)
+
+# Colors used for the 2x2 summary figures
+PANEL_COLORS = ('blue', 'green', 'red', 'purple')
+
+# Plotting results: one panel per quantity, two panels per row. The panels share the time axis,
+# so only the bottom row builds tick labels and an x label.
+def plot_time_series(results, names, figsize):
+    fig, axs = plt.subplots(len(names) // 2, 2, figsize=figsize, sharex=True)
+
+    for ax, name in zip(axs.flat, names):
+        title, label = QUANTITIES[name]
+        ax.plot(results['time_array'], results[f'{name}_array'])
+        ax.set_title(f'{title} Over Time')
+        ax.set_ylabel(label)
+    for ax in axs[-1]:
+        ax.set_xlabel('Time (s)')
+
+    plt.tight_layout()
+    return fig
+
+# Histograms
+def plot_histograms(results, names):
+    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+
+    for ax, name, color in zip(axs.flat, names, PANEL_COLORS):
+        title, label = QUANTITIES[name]
+        ax.hist(remove_non_finite(results[f'{name}_array']), bins=30, color=color)
+        ax.set_title(f'Histogram of {title}')
+        ax.set_xlabel(label)
+        ax.set_ylabel('Frequency')
+
+    plt.tight_layout()
+    return fig
+
+# Scatter Plots of each quantity over time
+def plot_time_scatter(results, names):
+    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+
+    for ax, name, color in zip(axs.flat, names, PANEL_COLORS):
+        title, label = QUANTITIES[name]
+        ax.plot(results['time_array'], results[f'{name}_array'], '.', color=color, markersize=1, rasterized=True)
+        ax.set_title(f'Scatter Plot of {title} Over Time')
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel(label)
+
+    plt.tight_layout()
+    return fig
+
+# Scatter Plots (Phase Space Graphs) for (x, y) quantity pairs
+def plot_phase_space(results, pairs):
+    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+
+    for ax, (x_name, y_name), color in zip(axs.flat, pairs, PANEL_COLORS):
+        x_title, x_label = QUANTITIES[x_name]
+        y_title, y_label = QUANTITIES[y_name]
+        ax.plot(results[f'{x_name}_array'], results[f'{y_name}_array'], '.', color=color, markersize=1, rasterized=True)
+        ax.set_title(f'Phase Space: {x_title} vs {y_title}')
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+
+    plt.tight_layout()
+    return fig
+
+# Box Plots
+def plot_box_plots(results, names):
+    fig, axs = plt.subplots(2, 2, figsize=(12, 8))
+
+    for ax, name in zip(axs.flat, names):
+        title, label = QUANTITIES[name]
+        ax.boxplot(remove_non_finite(results[f'{name}_array']))
+        ax.set_title(f'Box Plot of {title}')
+        ax.set_ylabel(label)
+
+    plt.tight_layout()
+    return fig
+
+# 3D Histogram for Field Strength Distribution
+def plot_field_strength_surface(time_array, observer_factors, Z):
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+
+    # Downsample the time axis to ~500 rows for plotting; the surface cannot show more than that on screen
+    stride = max(1, len(time_array) // 500)
+    X, Y = np.meshgrid(observer_factors, time_array[::stride])
+
+    ax.plot_surface(X, Y, Z[::stride], cmap='viridis')
+    ax.set_title('Field Strength Distribution Over Time for Different Observer Influence Factors')
+    ax.set_xlabel('Observer Influence Factor')
+    ax.set_ylabel('Time (s)')
+    ax.set_zlabel('Field Strength (J/m³)')
+
+    plt.tight_layout()
+    return fig
+
+# Function to run independent post-processing tasks (saving files, rendering figures) concurrently.
+# Tasks are module-level functions called with no arguments. On Linux they run in a pool of forked
+# workers that inherit the result arrays, so only the function names are pickled. pyplot is not
+# thread-safe and fork is unsafe for matplotlib elsewhere, so other platforms run the tasks in turn.
+def run_tasks(tasks):
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1 or sys.platform != 'linux':
+        for task in tasks:
+            task()
+    else:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            for result in [pool.apply_async(task) for task in tasks]:
+                result.get()
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
@@ -58,89 +59,83 @@ def magnetic_pressure_effect(B):
 # Magnetic permeability of free space
 mu_0 = 4 * np.pi * 1e-7
 
-# Simulation loop
+# Reciprocals used inside the loop, so each step multiplies instead of dividing
+inv_c = 1.0 / c
+inv_c2 = inv_c * inv_c
+inv_c4 = inv_c2 * inv_c2
+inv_cap = 1.0 / cap_value
+
+# Gradually introduce observers, then update field strength with observer influence using logarithmic
+# scaling, capped to prevent overflow. One clipped cumprod matches the step-by-step multiply-and-cap
+# only if the product never reaches the cap while a factor is below 1 (log1p(1.1) with one observer);
+# from 1e-20 the factors exceed 1 long before the product gets near cap_value
+observers = np.minimum(initial_observers + np.arange(len(time_array)) // observer_interval, 1e6)
+observer_factor = np.log1p(observer_influence_factor * observers)
+with np.errstate(over='ignore'):
+    field_strength_array[1:] = np.minimum(field_strength * np.cumprod(observer_factor[1:]), cap_value)
+
+# Simulation loop. The step works on Python floats with the math module, which skips the ufunc
+# dispatch np.sqrt/np.exp pay on every scalar call. Unlike NumPy, math.sqrt raises on a negative
+# argument and 1.0 / 0.0 raises, so the square roots are guarded and give the inf/nan NumPy would.
+# A non-finite plasma velocity falls back to the previous step's value, and a non-finite energy
+# density to cap_value.
 for i in range(1, len(time_array)):
-    try:
-        current_time = time_array[i]
-
-        # Update acceleration
-        acceleration = increasing_acceleration(current_time, total_time, max_acceleration)
-
-        # Update plasma velocity
-        plasma_velocity += (acceleration - damping_factor * plasma_velocity) * dt
-        if plasma_velocity >= c:
-            plasma_velocity = c - 1e-10  # Cap to just below the speed of light to avoid division by zero in Lorentz factor
-        lorentz_factor = 1 / np.sqrt(1 - (plasma_velocity / c)**2)
-
-        # Apply magnetic pressure effect for stabilization
-        pressure = magnetic_pressure_effect(B)
-        pressure_array[i] = pressure
-
-        # Gradually introduce observers
-        if i % observer_interval == 0 and current_observers < 1e6:
-            current_observers += 1  # Slowly increase the number of observers
-
-        # Update field strength with observer influence using logarithmic scaling
-        observer_factor = np.log1p(observer_influence_factor * current_observers)
-        field_strength *= observer_factor
-
-        # Cap field strength to prevent overflow
-        if field_strength > cap_value:
-            field_strength = cap_value
-
-        # Update energy density with a cap
-        energy_density = min(0.5 * (field_strength**2) * (plasma_velocity**2), cap_value)
-
-        # Calculate the volume of space influenced by the observers
-        volume = current_observers * volume_per_observer
-
-        # Update temperature
-        temperature += 1e5 * dt
-
-        # Update quantum tunneling probability and spacetime curvature
-        quantum_tunneling_probability = 1 - np.exp(-field_strength / cap_value)
-        spacetime_curvature = 2 * energy_density / (c**4)
-
-        # Calculate time dilation based on spacetime curvature and Lorentz factor
-        time_dilation = lorentz_factor * np.sqrt(1 - (2 * spacetime_curvature * mass_particle) / (c**2))
-
-        # Calculate probability of creating an interdimensional portal
-        dimension_portal_probability = np.tanh(spacetime_curvature / cap_value)
-
-        # Store data
-        plasma_velocity_array[i] = plasma_velocity
-        lorentz_factor_array[i] = lorentz_factor
-        energy_density_array[i] = energy_density
-        field_strength_array[i] = field_strength
-        temperature_array[i] = temperature
-        pressure_array[i] = pressure
-        quantum_tunneling_probability_array[i] = quantum_tunneling_probability
-        spacetime_curvature_array[i] = spacetime_curvature
-        volume_array[i] = volume
-        time_dilation_array[i] = time_dilation
-        dimension_portal_probability_array[i] = dimension_portal_probability
-
-    except OverflowError:
-        print(f"Overflow error at iteration {i}, capping values")
-        plasma_velocity_array[i] = plasma_velocity_array[i-1]
-        lorentz_factor_array[i] = lorentz_factor_array[i-1]
-        energy_density_array[i] = cap_value
-        field_strength_array[i] = field_strength_array[i-1]
-        temperature_array[i] = temperature_array[i-1]
-        pressure_array[i] = pressure_array[i-1]
-        quantum_tunneling_probability_array[i] = quantum_tunneling_probability_array[i-1]
-        spacetime_curvature_array[i] = spacetime_curvature_array[i-1]
-        volume_array[i] = volume_array[i-1]
-        time_dilation_array[i] = time_dilation_array[i-1]
-        dimension_portal_probability_array[i] = dimension_portal_probability_array[i-1]
-
-    except ZeroDivisionError:
-        print(f"Zero division error at iteration {i}, handling gracefully")
-        lorentz_factor = float('inf')
-        time_dilation = float('inf')
-        plasma_velocity_array[i] = plasma_velocity
-        lorentz_factor_array[i] = lorentz_factor
-        time_dilation_array[i] = time_dilation
+    current_time = i * dt  # Same value as time_array[i], as a Python float
+
+    # Update acceleration
+    acceleration = increasing_acceleration(current_time, total_time, max_acceleration)
+
+    # Update plasma velocity
+    plasma_velocity += (acceleration - damping_factor * plasma_velocity) * dt
+    if not math.isfinite(plasma_velocity):
+        plasma_velocity = plasma_velocity_array[i-1]
+    if plasma_velocity >= c:
+        plasma_velocity = c - 1e-10  # Cap to just below the speed of light to avoid division by zero in Lorentz factor
+    # c - 1e-10 rounds to c in float64, so the capped velocity can leave nothing under the square root
+    lorentz_term = 1.0 - (plasma_velocity * inv_c)**2
+    lorentz_factor = 1.0 / math.sqrt(lorentz_term) if lorentz_term > 0.0 else math.inf
+
+    # Apply magnetic pressure effect for stabilization
+    pressure = magnetic_pressure_effect(B)
+    pressure_array[i] = pressure
+
+    # Observer count and field strength for this step, precomputed above
+    current_observers = float(observers[i])
+    field_strength = float(field_strength_array[i])
+
+    # Update energy density with a cap
+    energy_density = min(0.5 * (field_strength * field_strength) * (plasma_velocity * plasma_velocity), cap_value)
+    if not math.isfinite(energy_density):
+        energy_density = cap_value
+
+    # Calculate the volume of space influenced by the observers
+    volume = current_observers * volume_per_observer
+
+    # Update temperature
+    temperature += 1e5 * dt
+
+    # Update quantum tunneling probability and spacetime curvature
+    quantum_tunneling_probability = 1.0 - math.exp(-field_strength * inv_cap)
+    spacetime_curvature = 2.0 * energy_density * inv_c4
+
+    # Calculate time dilation based on spacetime curvature and Lorentz factor
+    dilation_term = 1.0 - 2.0 * spacetime_curvature * mass_particle * inv_c2
+    time_dilation = lorentz_factor * math.sqrt(dilation_term) if dilation_term >= 0.0 else math.nan
+
+    # Calculate probability of creating an interdimensional portal
+    dimension_portal_probability = math.tanh(spacetime_curvature * inv_cap)
+
+    # Store data
+    plasma_velocity_array[i] = plasma_velocity
+    lorentz_factor_array[i] = lorentz_factor
+    energy_density_array[i] = energy_density
+    temperature_array[i] = temperature
+    pressure_array[i] = pressure
+    quantum_tunneling_probability_array[i] = quantum_tunneling_probability
+    spacetime_curvature_array[i] = spacetime_curvature
+    volume_array[i] = volume
+    time_dilation_array[i] = time_dilation
+    dimension_portal_probability_array[i] = dimension_portal_probability
 
 # Function to remove non-finite values
 def remove_non_finite(data):
@@ -235,9 +230,9 @@ for j, factor in enumerate(observer_factors):
     for i in range(1, len(time_array)):
         if i % observer_interval == 0:
             current_observers += 1
-        observer_factor = np.log1p(observer_influence_factor * current_observers)
+        observer_factor = math.log1p(observer_influence_factor * current_observers)
         field_strength *= observer_factor
-        field_strength = np.log1p(field_strength)
+        field_strength = math.log1p(field_strength)
         Z[i, j] = field_strength
 
 ax.plot_surface(X, Y, Z, cmap='viridis')